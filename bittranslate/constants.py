@@ -1,4 +1,15 @@
 """ File to hold values that should not be configurable. """
 
+import os
+
 VPERMIT_TAO_LIMIT = 1024
-TRACKER_HISTORY_COUNT = 100
\ No newline at end of file
+TRACKER_HISTORY_COUNT = 100
+
+# dtype names accepted for the text generation model. "auto" picks one based on the device.
+MGPT_DTYPES = ["auto", "float32", "float16", "bfloat16"]
+
+LID_MODEL_URL = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz"
+LID_MODEL_DIR = os.path.expanduser("~/.cache/bittranslate/")
+LID_MODEL_SHA256 = "8f3472cfe8738a7b6099e8e999c3cbfae0dcd15696aac7d7738a8039db603e83"
+# Seconds without data before the language identification model download is abandoned.
+LID_DOWNLOAD_TIMEOUT = 60
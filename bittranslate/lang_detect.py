@@ -0,0 +1,72 @@
+""" Language identification using fastText's compressed lid.176 model. """
+
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from typing import List, Optional
+from urllib.request import urlopen
+
+import fasttext
+
+from bittranslate.constants import LID_MODEL_URL, LID_MODEL_DIR, LID_MODEL_SHA256, LID_DOWNLOAD_TIMEOUT
+
+LABEL_PREFIX = "__label__"
+
+
+@lru_cache(maxsize=None)
+def load_model():
+    """ Load the language identification model once per process, downloading it on first use. """
+    model_path = os.path.join(LID_MODEL_DIR, os.path.basename(LID_MODEL_URL))
+    if not os.path.exists(model_path):
+        _download(LID_MODEL_URL, model_path, LID_MODEL_SHA256)
+    return fasttext.load_model(model_path)
+
+
+def _download(url: str, path: str, sha256: str):
+    """ Download `url` to `path`, only creating `path` once the download has completed
+        and its SHA-256 matches `sha256`. """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary file in the same directory so an interrupted or corrupted download
+    # never leaves a bad model behind, and the final rename is atomic.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+
+        digest = hashlib.sha256()
+        with f, urlopen(url, timeout=LID_DOWNLOAD_TIMEOUT) as response:
+            for chunk in iter(lambda: response.read(1 << 16), b""):
+                digest.update(chunk)
+                f.write(chunk)
+
+        if digest.hexdigest() != sha256:
+            raise ValueError(f"SHA-256 mismatch for {url}: expected {sha256}, got {digest.hexdigest()}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def detect_batch(texts: List[str]) -> List[Optional[str]]:
+    """ Return the ISO 639-1 code of the most likely language for each text, or None for blank texts. """
+    # fastText appends an end-of-line token to every input, so blank texts would still get a label.
+    indices = [i for i, text in enumerate(texts) if text.strip()]
+
+    preds = [None] * len(texts)
+    if not indices:
+        return preds
+
+    # fastText predicts one line at a time, so newlines are removed first.
+    labels, _ = load_model().predict([texts[i].replace("\n", " ") for i in indices], k=1)
+    for i, label in zip(indices, labels):
+        preds[i] = label[0][len(LABEL_PREFIX):]
+    return preds
+
+
+def detect(text: str) -> Optional[str]:
+    """ Return the ISO 639-1 code of the most likely language for a text, or None for a blank text. """
+    return detect_batch([text])[0]
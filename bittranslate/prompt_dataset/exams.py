@@ -1,7 +1,7 @@
-import random
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
 
-from datasets import Dataset, load_dataset
+from datasets import load_dataset
 from .prompt_dataset import PromptDataset
 
 LANGUAGE_SHORTHANDS = {
@@ -14,31 +14,35 @@ LANGUAGE_SHORTHANDS = {
     "vi": "Vietnamese"
 }
 
+@lru_cache(maxsize=None)
+def _load_exams() -> Dict[str, List[str]]:
+    """ Load the question stems for each language once per process. """
+    dataset = load_dataset("exams", "multilingual", split="train")
+    shorthands = {language: shorthand for shorthand, language in LANGUAGE_SHORTHANDS.items()}
+
+    lang_questions = {shorthand: [] for shorthand in LANGUAGE_SHORTHANDS}
+    for question, info in zip(dataset["question"], dataset["info"]):
+        # skip any potential None values and languages that are not used
+        shorthand = shorthands.get(info["language"])
+        if shorthand is not None and question["stem"] is not None:
+            lang_questions[shorthand].append(question["stem"])
+
+    return lang_questions
+
 class Exams(PromptDataset):
 
-    lang_datasets: Dict[str, Dataset]
-    """ Map of language shorthand to dataset filtered for said language. """
+    _lang_questions: Dict[str, List[str]]
+    """ Map of language shorthand to the question stems in said language. """
 
     def __init__(self):
         super().__init__()
-        self._dataset = load_dataset("exams", "multilingual", split="train")
-        # remove any potential None None values
-        self._dataset = self._dataset.filter(
-            lambda record: record["question"]["stem"] is not None and record["info"]["language"] is not None)
-
-        self._lang_datasets = {
-            shorthand : self._dataset.filter(
-                lambda record: record["info"]["language"] == language
-            )
-            for shorthand, language in LANGUAGE_SHORTHANDS.items()
-        }
+        self._lang_questions = _load_exams()
 
     def sample_case(self, language="en") -> str:
-        if language not in self._lang_datasets:
+        if language not in self._lang_questions:
             raise ValueError(
                 f"{language} is an invalid language. "
-                f"Valid languages include {list(self._lang_datasets.keys())}"
+                f"Valid languages include {list(self._lang_questions.keys())}"
             )
 
-        row = random.choice(self._lang_datasets[language])
-        return row["question"]["stem"]
\ No newline at end of file
+        return self._rng.choice(self._lang_questions[language])
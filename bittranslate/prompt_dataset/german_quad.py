@@ -1,16 +1,22 @@
+from functools import lru_cache
+from typing import List
+
 from datasets import load_dataset
 from .prompt_dataset import PromptDataset
-import random
+
+
+@lru_cache(maxsize=None)
+def _load_german_quad() -> List[str]:
+    """ Load the questions once per process. """
+    questions = load_dataset("deepset/germanquad", split="train")["question"]
+    return [question for question in questions if question is not None]
 
 
 class GermanQuAD(PromptDataset):
     def __init__(self):
         super().__init__()
-        self._dataset = load_dataset("deepset/germanquad", split="train")
-        self._dataset = self._dataset.filter(
-            lambda record: record["question"] is not None
-        )
-        self._dataset_len = len(self._dataset)
+        self._questions = _load_german_quad()
+        self._dataset_len = len(self._questions)
         self._valid_ln = ["de"]
 
     def sample_case(self, language="de") -> str:
@@ -19,5 +25,4 @@ class GermanQuAD(PromptDataset):
                 f"{language} is an invalid language. Valid languages include {self._valid_ln}"
             )
 
-        random_index = random.randint(0, self._dataset_len-1)
-        return self._dataset[random_index]["question"]
+        return self._questions[self._rng.randrange(self._dataset_len)]
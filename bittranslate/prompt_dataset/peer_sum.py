@@ -1,16 +1,24 @@
+from functools import lru_cache
+from typing import List
+
 from datasets import load_dataset
 from .prompt_dataset import PromptDataset
-import random
+
+
+@lru_cache(maxsize=None)
+def _load_peer_sum() -> List[str]:
+    """ Load the paper abstracts once per process. """
+    # Materialize the abstract column once, dropping missing values, so sampling
+    # avoids decoding an Arrow row per call.
+    abstracts = load_dataset("oaimli/PeerSum", split="train")["paper_abstract"]
+    return [abstract for abstract in abstracts if abstract is not None]
 
 
 class PeerSum(PromptDataset):
     def __init__(self):
         super().__init__()
-        self._dataset = load_dataset("oaimli/PeerSum", split="train")
-        self._dataset = self._dataset.filter(
-            lambda record: record["paper_abstract"] is not None
-        )
-        self._dataset_len = len(self._dataset)
+        self._abstracts = _load_peer_sum()
+        self._dataset_len = len(self._abstracts)
         self._valid_ln = ["en"]
 
     def sample_case(self, language="en") -> str:
@@ -19,5 +27,4 @@ class PeerSum(PromptDataset):
                 f"{language} is an invalid language. Valid languages include {self._valid_ln}"
             )
 
-        random_index = random.randint(0, self._dataset_len-1)
-        return self._dataset[random_index]["paper_abstract"]
+        return self._abstracts[self._rng.randrange(self._dataset_len)]
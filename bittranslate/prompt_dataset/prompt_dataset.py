@@ -1,9 +1,11 @@
+import random
 from abc import abstractmethod
 
 
 class PromptDataset:
     def __init__(self):
-        pass
+        # Per-instance RNG so sampling does not share the global random state across threads.
+        self._rng = random.Random()
 
     @abstractmethod
     def sample_case(self) -> str:
@@ -1,32 +1,35 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
 
-from datasets import Dataset, load_dataset
+from datasets import load_dataset
 from .prompt_dataset import PromptDataset
-import random
 
 LANGUAGES = [ 
     'ar', 'de', 'el', 'en', 'es', 'hi', 'ro', 'ru', 'th', 'tr', 'vi' 
 ]
 
+@lru_cache(maxsize=None)
+def _load_xquad() -> Dict[str, List[str]]:
+    """ Load the questions for each language once per process. """
+    return {
+        language : list(load_dataset("xquad", f"xquad.{language}", split="validation")["question"])
+        for language in LANGUAGES
+    }
+
 class XQuAD(PromptDataset):
 
-    _datasets: Dict[str, Dataset]
-    """ Map of datasets by language. """
+    _questions: Dict[str, List[str]]
+    """ Map of questions by language. """
 
     def __init__(self):
         super().__init__()
-
-        self._datasets = {
-            language : load_dataset("xquad", f"xquad.{language}", split="validation")
-            for language in LANGUAGES
-        }
+        self._questions = _load_xquad()
 
     def sample_case(self, language="en") -> str:
-        if language not in self._datasets:
+        if language not in self._questions:
             raise ValueError(
                 f"{language} is an invalid language. "
-                f"Valid languages include {list(self._datasets.keys())}"
+                f"Valid languages include {list(self._questions.keys())}"
             )
         
-        row = random.choice(self._datasets[language])
-        return row["question"]
\ No newline at end of file
+        return self._rng.choice(self._questions[language])
@@ -1,4 +1,5 @@
 from typing import List
+import numpy as np
 from .reward_model import RewardModel
 from bert_score import BERTScorer
 
@@ -10,9 +11,10 @@ class BertScore(RewardModel):
 
         self._bert_score = BERTScorer(model_type=model_type, device=self._device)
 
-    def score(self, source_text: str, translated_text: List[str]) -> List[float]:
-        source_texts = [source_text] * len(translated_text)
+    def score(self, source_text: str, translated_text: List[str]) -> np.ndarray:
+        return self.score_batch([source_text] * len(translated_text), translated_text)
 
-        _, _, f1 = self._bert_score.score(source_texts, translated_text)
+    def score_batch(self, source_texts: List[str], translated_texts: List[str]) -> np.ndarray:
+        _, _, f1 = self._bert_score.score(source_texts, translated_texts)
 
-        return f1.tolist()
+        return np.asarray(f1, dtype=np.float32)
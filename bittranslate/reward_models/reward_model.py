@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import List
+from typing import Dict, List
+import numpy as np
 
 
 class RewardModel:
@@ -7,5 +8,20 @@ class RewardModel:
         pass
 
     @abstractmethod
-    def score(self, source_text: str, translated_texts: List[str]) -> List[float]:
+    def score(self, source_text: str, translated_texts: List[str]) -> np.ndarray:
         pass
+
+    def score_batch(self, source_texts: List[str], translated_texts: List[str]) -> np.ndarray:
+        """ Score pairs of texts, where translated_texts[i] is a translation of source_texts[i].
+
+            Subclasses should override this to score every pair in one forward pass;
+            by default `score` is called once per distinct source text.
+        """
+        indices_by_source: Dict[str, List[int]] = {}
+        for i, source_text in enumerate(source_texts):
+            indices_by_source.setdefault(source_text, []).append(i)
+
+        scores = np.empty(len(translated_texts), dtype=np.float32)
+        for source_text, indices in indices_by_source.items():
+            scores[indices] = self.score(source_text, [translated_texts[i] for i in indices])
+        return scores
@@ -1,6 +1,7 @@
 from sentence_transformers import SentenceTransformer, util
 from .reward_model import RewardModel
 from typing import List
+import numpy as np
 
 
 class VectorSim(RewardModel):
@@ -8,9 +9,21 @@ class VectorSim(RewardModel):
         super().__init__()
         self._sent_trans_model = SentenceTransformer("sentence-transformers/LaBSE", device=device)
 
-    def score(self, source_text: str, translated_text: List[str]) -> List[float]:
+    def score(self, source_text: str, translated_text: List[str]) -> np.ndarray:
         en_source = self._sent_trans_model.encode(source_text)
         en_translated = self._sent_trans_model.encode(translated_text)
         scores = util.cos_sim(en_source, en_translated)
         # there's only once source text, and so we return the first element of scores.
-        return scores[0].tolist()
+        return np.asarray(scores[0].cpu(), dtype=np.float32)
+
+    def score_batch(self, source_texts: List[str], translated_texts: List[str]) -> np.ndarray:
+        # Each source text is shared by many translations, so only distinct sources are encoded.
+        unique_sources = list(dict.fromkeys(source_texts))
+        source_indices = {source_text: i for i, source_text in enumerate(unique_sources)}
+
+        en_sources = self._sent_trans_model.encode(unique_sources, convert_to_tensor=True)
+        en_translated = self._sent_trans_model.encode(translated_texts, convert_to_tensor=True)
+        en_sources = en_sources[[source_indices[source_text] for source_text in source_texts]]
+
+        scores = util.pairwise_cos_sim(en_sources, en_translated)
+        return np.asarray(scores.cpu(), dtype=np.float32)
@@ -3,9 +3,10 @@ import os
 import random
 from typing import List
 import numpy as np
+import torch
+from scipy.special import expit
 from itertools import permutations
 from transformers import pipeline
-from langdetect import detect
 from bittranslate.reward_models import BertScore, VectorSim
 from bittranslate.prompt_dataset.german_quad import GermanQuAD
 from bittranslate.prompt_dataset.exams import Exams
@@ -13,14 +14,75 @@ from bittranslate.prompt_dataset.peer_sum import PeerSum
 from bittranslate.prompt_dataset.prompt_dataset import PromptDataset
 from bittranslate.prompt_dataset.xquad import XQuAD
 from bittranslate.tracker import ValidatorTracker
-from bittranslate.constants import TRACKER_HISTORY_COUNT
+from bittranslate.constants import TRACKER_HISTORY_COUNT, MGPT_DTYPES
+from bittranslate.lang_detect import detect, detect_batch, load_model as load_lid_model
+
+
+def _select_torch_dtype(device: str, dtype: str) -> torch.dtype:
+    """ Map a dtype name to a torch dtype. "auto" uses half precision on GPUs and float32 otherwise. """
+    if dtype not in MGPT_DTYPES:
+        raise ValueError(f"{dtype} is an invalid dtype. Valid dtypes include {MGPT_DTYPES}")
+
+    if dtype == "float16" and torch.device(device).type == "cpu":
+        # Many CPU generation kernels lack float16 support, which would only fail at the first generation.
+        raise ValueError(f"dtype float16 is not supported on device {device}. Use float32 or bfloat16.")
+
+    if dtype != "auto":
+        return getattr(torch, dtype)
+
+    if device.startswith("cuda") and torch.cuda.is_available():
+        # bfloat16 needs compute capability 8.0 (Ampere) or newer.
+        major, _ = torch.cuda.get_device_capability(torch.device(device))
+        return torch.bfloat16 if major >= 8 else torch.float16
+
+    return torch.float32
+
+
+def _load_mgpt_pipeline(device: str, dtype: str):
+    """ Load the mGPT text generation pipeline used to expand dataset samples into prompts. """
+    mgpt_pipeline = pipeline(
+        "text-generation",
+        "ai-forever/mGPT",
+        device=device,
+        model_kwargs={"torch_dtype": _select_torch_dtype(device, dtype)},
+    )
+    # Batched generation pads prompts, which must happen on the left for decoder-only models.
+    mgpt_pipeline.tokenizer.padding_side = "left"
+    if mgpt_pipeline.tokenizer.pad_token is None:
+        mgpt_pipeline.tokenizer.pad_token = mgpt_pipeline.tokenizer.eos_token
+
+    mgpt_pipeline.model.eval()
+    # Fused attention kernels are an optional speedup, only applied when optimum is installed.
+    try:
+        from optimum.bettertransformer import BetterTransformer
+    except ImportError:
+        return mgpt_pipeline
+
+    try:  # nonessential code:
+        mgpt_pipeline.model = BetterTransformer.transform(mgpt_pipeline.model, keep_original_model=False)
+    except Exception as e:
+        print(f"BetterTransformer not applied to mGPT, using default attention. Error {str(e)}", file=sys.stderr)
+
+    return mgpt_pipeline
+
 
 class Validator:
-    def __init__(self, device: str = "cpu", out_dir: str= "bittranslate_out/" ):
+    def __init__(self, device: str = "cpu", out_dir: str= "bittranslate_out/", dtype: str = "auto",
+                 use_prompt_expansion: bool = True):
+        """ If `use_prompt_expansion` is False, dataset samples are sent to miners as-is instead of being
+            extended by mGPT. This skips the most expensive step of `generate_cases` and avoids loading mGPT,
+            at the cost of source texts that are not original and may already be known to miners. """
+        self._rng = random.Random()
+
         self._reward_models = [BertScore(device=device), VectorSim(device=device)]
 
         self._reward_weights = [0.5, 0.5]
-        self._mgpt_pipeline = pipeline("text-generation", "ai-forever/mGPT", device=device)
+        # Without prompt expansion mGPT is never called, so it is not loaded.
+        self._use_prompt_expansion = use_prompt_expansion
+        self._mgpt_pipeline = _load_mgpt_pipeline(device, dtype) if use_prompt_expansion else None
+
+        # Load the language identification model up front rather than on the first scoring step.
+        load_lid_model()
 
         self._langs = ["ar", "bg", "de", "el", "en",
                        "es", "hi", "hu", "it", "pl", "pt",
@@ -31,6 +93,9 @@ class Validator:
 
         self._prior_lang_pairs = list(permutations(self._prior_langs, 2))
 
+        prior_lang_pairs_set = set(self._prior_lang_pairs)
+        self._new_lang_pairs = [lang_pair for lang_pair in self._lang_pairs if lang_pair not in prior_lang_pairs_set]
+
         self.tracker = ValidatorTracker(self._lang_pairs, TRACKER_HISTORY_COUNT)
 
         self.out_dir = out_dir
@@ -59,48 +124,58 @@ class Validator:
                           "tr": [exams, xquad],
                           "vi": [xquad]
                           }
+        self._datasets = {lang: tuple(datasets) for lang, datasets in self._datasets.items()}
+
+        # Most languages have a single dataset, which can be returned without a random draw.
+        self._single_datasets = {
+            lang: datasets[0] if len(datasets) == 1 else None
+            for lang, datasets in self._datasets.items()
+        }
 
     def score(self, sources: List[str], translations: List[List[str]], source_lang: str, target_lang: str):
         len_sources = len(sources)
+        if len_sources == 0:
+            raise ValueError("At least one source is required.")
+        if len(translations) != len_sources:
+            raise ValueError(
+                f"Expected one list of translations per source, "
+                f"got {len(translations)} lists for {len_sources} sources."
+            )
+
         miners_count = len(translations[0])
-        all_scores = [0]*miners_count
-        overall_top_max_score = 0
-        overall_top_max_source = ""
-        overall_top_max_target = ""
-        overall_top_min_score = 1.1
-        overall_top_min_source = ""
-        overall_top_min_target = ""
-
-        top_translations = []
-        top_scores = []
-
-        for s, t in zip(sources, translations):
-            # s: single source text
-            # t: a list of translation where index contains a translation from a given miner.
-            # l: target language
-
-            scores = self.single_score(s, t, target_lang)
-            all_scores = [a + b for a, b in zip(all_scores, scores)]
-
-            max_score = max(scores)
-            min_score = min(scores)
-            max_score_index = scores.index(max_score)
-            min_score_index = scores.index(min_score)
-            max_score_value = t[max_score_index]
-            top_translations.append(max_score_value)
-            top_scores.append(max_score)
-            if max_score > overall_top_max_score:
-                overall_top_max_score = max_score
-                overall_top_max_source = s
-                overall_top_max_target = max_score_value
-
-            min_score_value = t[min_score_index]
-            if min_score < overall_top_min_score:
-                overall_top_min_score = min_score
-                overall_top_min_source = s
-                overall_top_min_target = min_score_value
-
-        final_scores = [score/len_sources for score in all_scores]
+        if miners_count == 0 or any(len(t) != miners_count for t in translations):
+            raise ValueError(
+                f"Every source needs one translation per miner, "
+                f"got translation counts {[len(t) for t in translations]}."
+            )
+
+        # Score every (source, translation) pair at once so each reward model runs one large batch.
+        flat_sources = [s for s, t in zip(sources, translations) for _ in t]
+        flat_translations = [translation for t in translations for translation in t]
+
+        # scores_mat[source_index][miner_index]
+        scores_mat = self._score_pairs(flat_sources, flat_translations, target_lang).reshape(len_sources, miners_count)
+
+        final_scores = (scores_mat.sum(axis=0) / len_sources).tolist()
+
+        source_indices = np.arange(len_sources)
+        max_idx = scores_mat.argmax(axis=1)
+        max_vals = scores_mat[source_indices, max_idx]
+        min_idx = scores_mat.argmin(axis=1)
+        min_vals = scores_mat[source_indices, min_idx]
+
+        top_translations = [translations[i][max_idx[i]] for i in range(len_sources)]
+        top_scores = max_vals.tolist()
+
+        top_max_source_index = int(max_vals.argmax())
+        overall_top_max_score = float(max_vals[top_max_source_index])
+        overall_top_max_source = sources[top_max_source_index]
+        overall_top_max_target = top_translations[top_max_source_index]
+
+        top_min_source_index = int(min_vals.argmin())
+        overall_top_min_score = float(min_vals[top_min_source_index])
+        overall_top_min_source = sources[top_min_source_index]
+        overall_top_min_target = translations[top_min_source_index][min_idx[top_min_source_index]]
 
         # Track scores
         try: # nonessential code:
@@ -125,94 +200,109 @@ class Validator:
         return final_scores, top_translations, top_scores
 
     def single_score(self, source: str, translations: List[str], target_lang: str) -> List[float]:
+        return self._score_pairs([source] * len(translations), translations, target_lang).tolist()
 
-        lang_filter = self._filter_lang(translations, target_lang)
+    def _score_pairs(self, sources: List[str], translations: List[str], target_lang: str) -> np.ndarray:
+        """ Score translations[i] as a translation of sources[i] for every pair. """
 
-        reward_scores = [0.0] * len(translations)
-        for i, reward_model in enumerate(self._reward_models):
-            # Produce scores with a Reward Model
-            scores = reward_model.score(source, translations)
+        lang_filter = self._filter_lang(translations, target_lang)
 
-            # Sigmoid normalization
-            norm_scores = self._sigmoid_normalize(scores)
+        # Translations in the wrong language score 0, so only the rest go through the Reward Models.
+        keep_idx = [i for i, keep in enumerate(lang_filter) if keep]
+        result = np.zeros(len(translations), dtype=np.float32)
+        if not keep_idx:
+            return result
 
-            # Get the weight for the Reward Model
-            weight = self._reward_weights[i]
+        # Miners often return identical translations, so each distinct pair is scored once.
+        # unique_pairs maps a pair to its index; inverse maps each kept pair to its unique index.
+        unique_pairs = {}
+        inverse = np.empty(len(keep_idx), dtype=np.int64)
+        for k, i in enumerate(keep_idx):
+            inverse[k] = unique_pairs.setdefault((sources[i], translations[i]), len(unique_pairs))
 
-            # Multiply each score based on its weight
-            weighted_scores = [float(score * weight) for score in norm_scores]
+        unique_sources = [source for source, _ in unique_pairs]
+        unique_translations = [translation for _, translation in unique_pairs]
 
-            # Add the resulting weighted scores to the total reward_scores list
-            reward_scores = [
-                current_score + new_score
-                for current_score, new_score in zip(reward_scores, weighted_scores)
-            ]
+        # Sigmoid normalized scores from each Reward Model, shape (reward models, unique pairs)
+        norm_scores = np.stack([
+            self._sigmoid_normalize(reward_model.score_batch(unique_sources, unique_translations))
+            for reward_model in self._reward_models
+        ])
 
-        result = [a * b for a, b in zip(lang_filter, reward_scores)]
+        # Weighted sum over the Reward Models
+        unique_scores = np.asarray(self._reward_weights, dtype=np.float32) @ norm_scores
+        result[keep_idx] = unique_scores[inverse]
 
         return result
 
-    def _sigmoid_normalize(self, scores: List[float]) -> List[float]:
-        np_scores = np.array(scores)
-        norm_scores = 1 / (1 + np.exp(-np_scores))
-
-        return norm_scores.tolist()
+    def _sigmoid_normalize(self, scores: np.ndarray) -> np.ndarray:
+        if not isinstance(scores, np.ndarray):
+            # Reward Models may still return a list of floats.
+            scores = np.asarray(scores, dtype=np.float32)
+        return expit(scores)
 
     def _get_source_dataset(self) -> (PromptDataset, str, str):
 
         source_lang, target_lang = self._select_lang_pair()
 
-        source_datasets = self._datasets[source_lang]
-
-        random_dataset_index = random.randint(0, len(source_datasets) - 1)
-        source_dataset = source_datasets[random_dataset_index]
+        source_dataset = self._single_datasets[source_lang]
+        if source_dataset is None:
+            source_dataset = self._rng.choice(self._datasets[source_lang])
 
         return source_dataset, source_lang, target_lang
 
 
     def generate_cases(self, count: int=2) -> (str, str, List[str]):
-        sources = []
-
         source_dataset, source_lang, target_lang = self._get_source_dataset()
 
-        for i in range(0, count):
-            starting_case = source_dataset.sample_case(source_lang)
-            prompt = self._generate_prompt(starting_case)
-            sources.append(prompt)
+        starting_cases = [source_dataset.sample_case(source_lang) for _ in range(count)]
+
+        if not self._use_prompt_expansion:
+            return source_lang, target_lang, starting_cases
+
+        sources = self._generate_prompts(starting_cases)
         return source_lang, target_lang, sources
 
     def _generate_prompt(self, text: str) -> str:
-        current_token_length = len(self._mgpt_pipeline.tokenizer.encode(text))
-        return self._mgpt_pipeline(
-            text,
+        return self._generate_prompts([text])[0]
+
+    def _generate_prompts(self, texts: List[str]) -> List[str]:
+        if not self._use_prompt_expansion:
+            raise RuntimeError("Prompt generation requires a Validator created with use_prompt_expansion=True.")
+
+        # Generate all prompts in a single padded batch rather than one pipeline call per text.
+        # Lengths are relative to each prompt, so no per-text token offsets are needed.
+        outputs = self._mgpt_pipeline(
+            texts,
+            batch_size=len(texts),
             return_full_text=False,
             no_repeat_ngram_size=3,
             do_sample=True,
             top_k=10,
             temperature=1,
-            min_length=32 + current_token_length,
-            max_length=64 + current_token_length,
-        )[0]["generated_text"]
+            min_new_tokens=32,
+            max_new_tokens=64,
+        )
 
+        return [output[0]["generated_text"] for output in outputs]
 
-    def _filter_lang(self, translations, target_lang):
-        # Lang detection filter
-        lang_filter = []
 
-        for translation in translations:
-            try:
-                pred = detect(translation)
-
-            except Exception as e:
-                lang_filter.append(0)
-                print(f"Language detection exception. Error {str(e)}. Translation: {translation}", file=sys.stderr)
-                continue
-            if pred == target_lang:
-                lang_filter.append(1)
-            else:
-                lang_filter.append(0)
-
-        return lang_filter
+    def _filter_lang(self, translations, target_lang):
+        # Lang detection filter, run as a single batched prediction.
+        try:
+            preds = detect_batch(translations)
+        except Exception:
+            # A single invalid translation fails the whole batch, so detect each translation
+            # separately and only give 0 to the translations that cannot be detected.
+            preds = []
+            for translation in translations:
+                try:
+                    preds.append(detect(translation))
+                except Exception as e:
+                    preds.append(None)
+                    print(f"Language detection exception. Error {str(e)}. Translation: {translation}", file=sys.stderr)
+
+        return [1 if pred == target_lang else 0 for pred in preds]
 
     def save_tracked_results(self):
         out_scores_path = self.out_dir + "scores.json"
@@ -221,17 +311,8 @@ class Validator:
         self.tracker.texts_to_json(out_texts_path)
 
     def _select_lang_pair(self):
-        new_lang_pairs = [lang for lang in self._lang_pairs if lang not in self._prior_lang_pairs]
-
-        random_0_1 = random.random()
-        if random_0_1 < 0.95:
-            # Use prior language pairs 95% of the time
-            lang_pairs = self._prior_lang_pairs
-        else:
-            lang_pairs = new_lang_pairs
-
-        random_lang_pair_index = random.randint(0, len(lang_pairs) - 1)
-        random_lang_pair = lang_pairs[random_lang_pair_index]
-        source_lang = random_lang_pair[0]
-        target_lang = random_lang_pair[1]
+        # Use prior language pairs 95% of the time
+        lang_pairs = self._prior_lang_pairs if self._rng.random() < 0.95 else self._new_lang_pairs
+
+        source_lang, target_lang = self._rng.choice(lang_pairs)
         return source_lang, target_lang
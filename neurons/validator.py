@@ -42,6 +42,12 @@ def get_config():
 
     parser = argparse.ArgumentParser()
     parser.add_argument('--device', default="cuda", help="The device used for the validator's components.")
+    parser.add_argument(
+        "--dtype",
+        default="auto",
+        choices=constants.MGPT_DTYPES,
+        help="The dtype used for the text generation model. 'auto' uses half precision on GPUs and float32 otherwise."
+    )
     # Adds override arguments for network and netuid.
     parser.add_argument( '--netuid', type = int, default = 2, help = "The chain subnet uid." )
 
@@ -113,6 +119,12 @@ def get_config():
         help="If set, artificial data will not be sent to miners for the purpose of scoring. We only recommend setting this to true to when debugging the API."
     )
 
+    parser.add_argument(
+        "--no_prompt_expansion",
+        action="store_true",
+        help="If set, dataset samples are sent to miners without being extended by the text generation model. This greatly reduces the cost of generating cases, but the source texts are not original."
+    )
+
     parser.add_argument(
         "--ngrok_domain",
         help=(
@@ -321,7 +333,12 @@ def main( config ):
     alpha = 0.98
 
     ## Custom Initialization
-    validator = Validator(device=config.device, out_dir=config.out_dir)
+    validator = Validator(
+        device=config.device,
+        out_dir=config.out_dir,
+        dtype=config.dtype,
+        use_prompt_expansion=not config.no_prompt_expansion
+    )
 
     if config.enable_api:
         # external requests
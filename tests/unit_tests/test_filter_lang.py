@@ -22,4 +22,24 @@ def test_filter_lang():
     assert scores_pl_en[0] == 0
     assert scores_pl_en[1] > 0
     assert scores_pl_en[2] == 0
-    assert scores_pl_en[3] > 0
\ No newline at end of file
+    assert scores_pl_en[3] > 0
+
+
+def test_filter_lang_invalid_translation():
+    # A lone surrogate cannot be encoded to UTF-8, which makes a batched prediction fail.
+    translated_text = ["Napiszmy dzisiaj trochę kodu.", "\ud800", "Nie mogę się doczekać kodowania."]
+    result = validator._filter_lang(translated_text, "pl")
+    assert result == [1, 0, 1]
+
+    # The other miners keep their scores.
+    scores, _, _ = validator.score(["Let's write some code today."], [translated_text], "en", "pl")
+    assert scores[0] > 0
+    assert scores[1] == 0
+    assert scores[2] > 0
+
+
+def test_filter_lang_blank_translation():
+    translated_text = ["Napiszmy dzisiaj trochę kodu.", "", " \n"]
+    for target_lang in validator._langs:
+        result = validator._filter_lang(translated_text, target_lang)
+        assert result[1:] == [0, 0]
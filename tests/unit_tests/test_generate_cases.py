@@ -1,3 +1,6 @@
+import pytest
+
+from bittranslate import PromptDataset
 from .validator import validator
 
 
@@ -16,3 +19,27 @@ def test_generate_cases():
         assert 50 <= token_len <= 100
 
 
+class FixedDataset(PromptDataset):
+    def __init__(self):
+        super().__init__()
+        self.samples = 0
+
+    def sample_case(self, language="en") -> str:
+        self.samples += 1
+        return f"sample {self.samples}"
+
+
+def test_generate_cases_without_prompt_expansion(monkeypatch):
+    dataset = FixedDataset()
+    monkeypatch.setattr(validator, "_use_prompt_expansion", False)
+    # mGPT must not be used when prompt expansion is disabled.
+    monkeypatch.setattr(validator, "_mgpt_pipeline", None)
+    monkeypatch.setattr(validator, "_get_source_dataset", lambda: (dataset, "en", "pl"))
+
+    source_lang, target_lang, sources = validator.generate_cases(count=3)
+    assert source_lang == "en"
+    assert target_lang == "pl"
+    assert sources == ["sample 1", "sample 2", "sample 3"]
+
+    with pytest.raises(RuntimeError):
+        validator._generate_prompt("hello world")
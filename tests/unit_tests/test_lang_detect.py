@@ -0,0 +1,42 @@
+import hashlib
+import os
+
+import pytest
+
+from bittranslate.lang_detect import detect, detect_batch, _download
+
+
+def test_detect():
+    assert detect("Let's write some code today.") == "en"
+    assert detect("Napiszmy dzisiaj trochę kodu.") == "pl"
+    # Newlines must not break detection.
+    assert detect("Napiszmy dzisiaj\ntrochę kodu.") == "pl"
+
+
+def test_detect_batch():
+    texts = ["Let's write some code today.", "Napiszmy dzisiaj trochę kodu.", "Schreiben wir heute etwas Code."]
+    assert detect_batch(texts) == ["en", "pl", "de"]
+
+
+def test_detect_blank():
+    assert detect("") is None
+    assert detect(" \n\t") is None
+    assert detect_batch(["Napiszmy dzisiaj trochę kodu.", "", "  "]) == ["pl", None, None]
+
+
+@pytest.mark.lite
+def test_download(tmp_path):
+    data = b"model bytes"
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    url = source.as_uri()
+
+    target = tmp_path / "cache" / "model.bin"
+    _download(url, str(target), hashlib.sha256(data).hexdigest())
+    assert target.read_bytes() == data
+
+    # A file that does not match the pinned hash is never moved into place.
+    bad_target = tmp_path / "cache" / "bad.bin"
+    with pytest.raises(ValueError):
+        _download(url, str(bad_target), "0" * 64)
+    assert sorted(os.listdir(tmp_path / "cache")) == ["model.bin"]
@@ -1,6 +1,6 @@
 from bittranslate import Exams, XQuAD, PeerSum,  GermanQuAD
 import pytest
-from langdetect import detect
+from bittranslate.lang_detect import detect
 
 def test_peer_sum():
     peer_sum = PeerSum()
@@ -12,6 +12,9 @@ def test_peer_sum():
     with pytest.raises(ValueError):
         result = peer_sum.sample_case("pl")
 
+    # The dataset is only loaded once per process.
+    assert PeerSum()._abstracts is peer_sum._abstracts
+
 def test_german_quad():
     german_quad = GermanQuAD()
     result = german_quad.sample_case("de")
@@ -1,7 +1,8 @@
 from bittranslate import BertScore
-from .test_score import run_test_score
+from .test_score import run_test_score, run_test_score_batch
 
 def test_reward_bert_score():
     bert_score = BertScore()
     run_test_score(bert_score, False)
+    run_test_score_batch(bert_score)
 
@@ -1,9 +1,10 @@
 from bittranslate import VectorSim
-from .test_score import run_test_score
+from .test_score import run_test_score, run_test_score_batch
 
 def test_reward_bert_score():
     vector_sim = VectorSim()
     run_test_score(vector_sim, False)
+    run_test_score_batch(vector_sim)
 
 
 
@@ -1,4 +1,5 @@
 from typing import Union
+import numpy as np
 from bittranslate import RewardModel
 from .shared_data import SOURCE_TEXT, TRANSLATED_TEXTS
 from bittranslate import Validator
@@ -9,8 +10,12 @@ def run_test_score(reward_model: Union[RewardModel, Validator], is_validator: bo
     else:
         result = reward_model.score(SOURCE_TEXT, TRANSLATED_TEXTS)
 
-    assert type(result) == list
-    assert all(isinstance(score, float) for score in result)
+    if is_validator:
+        assert type(result) == list
+        assert all(isinstance(score, float) for score in result)
+    else:
+        assert type(result) == np.ndarray
+        assert result.dtype == np.float32
     # TRANSLATED_TEXTS is in descending order by quality of the translation
     assert all(result[i] > result[i + 1] for i in range(len(result) - 1))
 
@@ -24,5 +29,17 @@ def run_test_score(reward_model: Union[RewardModel, Validator], is_validator: bo
     assert all(result_reversed[i] < result_reversed[i + 1] for i in range(len(result_reversed) - 1))
 
 
+def run_test_score_batch(reward_model: RewardModel):
+    other_source_text = "I am at my desk"
+    other_translated_texts = ["Jestem przy biurku", "Nie ma mnie przy biurku"]
+
+    source_texts = [SOURCE_TEXT] * len(TRANSLATED_TEXTS) + [other_source_text] * len(other_translated_texts)
+    result = reward_model.score_batch(source_texts, TRANSLATED_TEXTS + other_translated_texts)
 
+    assert type(result) == np.ndarray
+    assert result.shape == (len(source_texts),)
 
+    # Batched scores match scoring each source on its own.
+    expected = list(reward_model.score(SOURCE_TEXT, TRANSLATED_TEXTS)) + \
+        list(reward_model.score(other_source_text, other_translated_texts))
+    assert np.allclose(result, expected, atol=1e-4)
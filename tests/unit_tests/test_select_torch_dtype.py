@@ -0,0 +1,32 @@
+import pytest
+import torch
+
+from bittranslate.validator import _select_torch_dtype
+
+
+@pytest.mark.lite
+def test_select_torch_dtype_auto_cpu():
+    assert _select_torch_dtype("cpu", "auto") == torch.float32
+
+
+@pytest.mark.lite
+def test_select_torch_dtype_explicit():
+    assert _select_torch_dtype("cpu", "float32") == torch.float32
+    assert _select_torch_dtype("cpu", "bfloat16") == torch.bfloat16
+    # Explicit names are passed through on GPUs without querying the device.
+    assert _select_torch_dtype("cuda", "float16") == torch.float16
+    assert _select_torch_dtype("cuda:0", "bfloat16") == torch.bfloat16
+
+
+@pytest.mark.lite
+def test_select_torch_dtype_float16_cpu():
+    with pytest.raises(ValueError):
+        _select_torch_dtype("cpu", "float16")
+
+
+@pytest.mark.lite
+def test_select_torch_dtype_invalid():
+    with pytest.raises(ValueError):
+        _select_torch_dtype("cpu", "foo")
+    with pytest.raises(ValueError):
+        _select_torch_dtype("cuda", "int8")
@@ -2,6 +2,8 @@ from bittranslate import RewardModel
 from .test_score import run_test_score
 from .validator import validator
 from math import factorial
+import numpy as np
+import pytest
 
 
 def test_valid_reward_models():
@@ -14,8 +16,8 @@ def test_reward_weights():
 def test_sigmoid_normalization():
     scores = [-4, -2, -1, 0, 1, 2, 4]
     result = validator._sigmoid_normalize(scores)
-    assert type(result) == list
-    assert all(isinstance(score, float) for score in result)
+    assert type(result) == np.ndarray
+    assert result.dtype == np.float32
     answers =  [0.01798620996209156, 0.11920292202211755, 0.2689414213699951, 0.5, 0.7310585786300049, 0.8807970779778823, 0.9820137900379085]
     for pred, answer in zip(result, answers):
         assert abs(pred - answer) < 0.001
@@ -95,6 +97,51 @@ def test_scores_pl_en():
     print(translated_texts_reversed)
     assert all(scores_reversed[i] < scores_reversed[i + 1] for i in range(len(scores_reversed) - 1))
 
+def test_score_pairs_deduplication(monkeypatch):
+    sources = ["This is example text.", "This is example text.", "This is example text.",
+               "I am at my desk", "I am at my desk"]
+    translations = ["To jest przykładowy tekst",
+                    "To jest przykładowy tekst",
+                    "To jest ołówek",
+                    "To jest przykładowy tekst",
+                    "Jestem przy biurku"]
+
+    # Record how many pairs each Reward Model is asked to score.
+    batch_sizes = []
+    for reward_model in validator._reward_models:
+        def score_batch(source_texts, translated_texts, _score_batch=reward_model.score_batch):
+            batch_sizes.append(len(translated_texts))
+            return _score_batch(source_texts, translated_texts)
+        monkeypatch.setattr(reward_model, "score_batch", score_batch)
+
+    result = validator._score_pairs(sources, translations, "pl")
+
+    # Identical pairs are scored once and share a score.
+    assert batch_sizes == [4] * len(validator._reward_models)
+    assert result[0] == result[1]
+    # The same translation of a different source is not merged.
+    assert result[0] != result[3]
+    # The translation scores higher against the source it actually translates.
+    assert result[0] > result[3]
+
+
+def test_score_invalid_shape():
+    source_texts = ["This is example text.", "I am at my desk"]
+
+    # Fewer translation lists than sources.
+    with pytest.raises(ValueError):
+        validator.score(source_texts, [["To jest przykładowy tekst"]], "en", "pl")
+
+    # Miners missing from one source.
+    with pytest.raises(ValueError):
+        validator.score(source_texts, [["To jest przykładowy tekst", "To jest ołówek"],
+                                       ["Jestem przy biurku"]], "en", "pl")
+
+    # No miners.
+    with pytest.raises(ValueError):
+        validator.score(source_texts, [[], []], "en", "pl")
+
+
 def test_unique_langs():
     assert len(validator._langs) == len(set(validator._langs))
 